@@ -1,28 +1,97 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, ValidationError, model_validator
+from typing import List, Optional, Literal
 import uuid
 from datetime import datetime, timezone
-from transformers import pipeline
-from emergentintegrations.llm.chat import LlmChat, UserMessage
-import asyncio
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Thread settings must be in the environment before torch is imported. Count
+# the CPUs this process may run on (not the host's, inside containers); the
+# default assumes two hardware threads per physical core.
+if hasattr(os, "sched_getaffinity"):
+    AVAILABLE_CPUS = len(os.sched_getaffinity(0))
+else:
+    AVAILABLE_CPUS = os.cpu_count() or 1
+TORCH_NUM_THREADS = max(1, int(
+    os.environ.get('TORCH_NUM_THREADS')
+    or os.environ.get('OMP_NUM_THREADS')
+    or AVAILABLE_CPUS // 2
+))
+# Each inference worker fans out over TORCH_NUM_THREADS intra-op threads
+INFERENCE_WORKERS = max(1, AVAILABLE_CPUS // TORCH_NUM_THREADS)
+os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(TORCH_NUM_THREADS))
+if INFERENCE_WORKERS == 1:
+    # Pin to physical cores only with a single worker; concurrent workers would
+    # each bind their thread team to the same first cores
+    os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")  # Intel OpenMP
+    os.environ.setdefault("OMP_PROC_BIND", "close")  # GNU OpenMP
+    os.environ.setdefault("OMP_PLACES", "cores")
+
+from transformers import (
+    AutoModelForSeq2SeqLM, AutoTokenizer, TextIteratorStreamer, StoppingCriteria, StoppingCriteriaList
+)
+from transformers.modeling_outputs import BaseModelOutput
+import torch
+torch.set_num_threads(TORCH_NUM_THREADS)
+torch.set_num_interop_threads(2)
+from emergentintegrations.llm.chat import LlmChat, UserMessage
+import asyncio
+import functools
+import threading
+import hashlib
+import tempfile
+import orjson
+import redis.asyncio as aioredis
+from concurrent.futures import ThreadPoolExecutor
+from async_batcher.batcher import AsyncBatcher
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# tz_aware so stored UTC timestamps come back (and serialize) as UTC
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
+# Optional Redis cache for inference results, keyed by a hash of the inputs
+redis_url = os.environ.get('REDIS_URL')
+CACHE_TTL_SECONDS = 86400
+CACHE_TIMEOUT_SECONDS = 0.2
+# Short timeouts and no retries: an unreachable cache must cost a request
+# at most a fraction of a second, not a TCP timeout
+redis_client = aioredis.from_url(
+    redis_url,
+    decode_responses=True,
+    socket_connect_timeout=CACHE_TIMEOUT_SECONDS,
+    socket_timeout=CACHE_TIMEOUT_SECONDS,
+    retry_on_timeout=False,
+    retry=None
+) if redis_url else None
+
+# Saved content is buffered and written in batches off the request path
+SAVE_BATCH_SIZE = 50
+SAVE_FLUSH_INTERVAL = 0.1  # seconds
+# Bound on buffered docs so a stalled Mongo can't grow memory without limit
+SAVE_QUEUE_MAXSIZE = 10000
+save_queue = asyncio.Queue(maxsize=SAVE_QUEUE_MAXSIZE)
+# In-flight insert_many tasks, referenced here so they aren't garbage collected
+pending_writes = set()
+# Cap on concurrent insert_many calls so a slow Mongo can't pile them up
+MAX_PENDING_WRITES = 4
+write_slots = asyncio.Semaphore(MAX_PENDING_WRITES)
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+# Flipped once models are loaded and warmed up
+app.state.ready = False
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -30,6 +99,22 @@ api_router = APIRouter(prefix="/api")
 # Global storage for models
 models = {}
 
+# Bounded pool for blocking model inference, sized so the workers' intra-op
+# threads don't oversubscribe the cores
+inference_executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="inference")
+
+# Inference backend: "torch" (PyTorch) or "onnx" (ONNX Runtime, CPU)
+INFERENCE_BACKEND = os.environ.get('INFERENCE_BACKEND', 'torch').lower()
+# PyTorch models run in half precision on GPU and INT8-quantized on CPU
+DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+if DEVICE.type == "cuda":
+    DTYPE = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+else:
+    DTYPE = torch.float32
+# Opt-in: Inductor compilation of the per-step forward pass (slow first requests per shape)
+TORCH_COMPILE = os.environ.get('TORCH_COMPILE', '').lower() in ('1', 'true', 'yes')
+ONNX_MODELS_DIR = ROOT_DIR / 'onnx_models'
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,32 +122,338 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def load_torch_model(model_name: str):
+    """Load a seq2seq model in half precision on GPU, or with INT8 dynamically quantized Linear layers on CPU."""
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, dtype=DTYPE)
+    model.eval()
+    if DEVICE.type == "cuda":
+        model = model.to(DEVICE)
+    else:
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    # The encoder's fp16 overflow clamp is data-dependent and tracing would bake
+    # in the untaken branch, so fp16 models keep the eager encoder
+    if DTYPE is not torch.float16:
+        try:
+            trace_encoder(model, tokenizer)
+        except Exception as e:
+            logger.warning(f"Encoder tracing failed for {model_name}, using eager encoder: {str(e)}")
+    if TORCH_COMPILE:
+        # generate() calls self.forward each decoding step, so compile the bound
+        # method rather than wrapping the module
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", dynamic=True)
+    return model, tokenizer
+
+class EncoderForward(torch.nn.Module):
+    """Positional-argument, tensor-only view of an encoder so it can be traced."""
+    def __init__(self, encoder):
+        super().__init__()
+        self.encoder = encoder
+
+    def forward(self, input_ids, attention_mask):
+        return self.encoder(input_ids=input_ids, attention_mask=attention_mask, return_dict=False)[0]
+
+class TracedEncoder(torch.nn.Module):
+    """Exposes a traced encoder through the keyword/ModelOutput interface generate() expects."""
+    def __init__(self, traced):
+        super().__init__()
+        self.traced = traced
+
+    def forward(self, input_ids, attention_mask=None, **kwargs):
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+        return BaseModelOutput(last_hidden_state=self.traced(input_ids, attention_mask))
+
+def trace_encoder(model, tokenizer):
+    """JIT-trace and freeze the model's encoder, then route generate() through it."""
+    eager = EncoderForward(model.get_encoder()).eval()
+    dummy = tokenizer(["SmartLearn encoder trace input"] * 2, return_tensors="pt").to(DEVICE)
+    # A padded batch of another length, to catch shape-dependent branches or
+    # values the trace baked in as constants
+    check = tokenizer(
+        ["Short check", "A noticeably longer sentence to check the traced encoder against"],
+        padding=True,
+        return_tensors="pt"
+    ).to(DEVICE)
+    with torch.no_grad():
+        traced = torch.jit.trace(
+            eager,
+            example_inputs=(dummy["input_ids"], dummy["attention_mask"]),
+            strict=False
+        )
+        traced = torch.jit.freeze(traced)
+        expected = eager(check["input_ids"], check["attention_mask"])
+        actual = traced(check["input_ids"], check["attention_mask"])
+    tolerance = 1e-4 if DTYPE is torch.float32 else 1e-2
+    if actual.shape != expected.shape or not torch.allclose(
+        actual.float(), expected.float(), rtol=tolerance, atol=tolerance
+    ):
+        raise RuntimeError("traced encoder output differs from eager on a new input length")
+    encoder = TracedEncoder(traced)
+    model.get_encoder = lambda: encoder
+
+def load_onnx_model(model_name: str):
+    """Export a seq2seq model to ONNX and run it with ORT's fused transformer graph."""
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTOptimizer
+    from optimum.onnxruntime.configuration import OptimizationConfig
+
+    save_dir = ONNX_MODELS_DIR / model_name.replace("/", "--")
+    if not save_dir.exists():
+        ONNX_MODELS_DIR.mkdir(parents=True, exist_ok=True)
+        # Build in a scratch directory and move it into place only once complete,
+        # so an interrupted export is never mistaken for a cached model
+        with tempfile.TemporaryDirectory(dir=ONNX_MODELS_DIR) as tmp_dir:
+            export_dir = Path(tmp_dir) / "model"
+            ort_model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+            optimizer = ORTOptimizer.from_pretrained(ort_model)
+            optimizer.optimize(
+                save_dir=export_dir,
+                optimization_config=OptimizationConfig(optimization_level=99, fp16=False)
+            )
+            export_dir.rename(save_dir)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    ort_model = ORTModelForSeq2SeqLM.from_pretrained(save_dir)
+    return ort_model, tokenizer
+
+def load_seq2seq_model(model_name: str, **generate_kwargs) -> dict:
+    if INFERENCE_BACKEND == "onnx":
+        model, tokenizer = load_onnx_model(model_name)
+    else:
+        model, tokenizer = load_torch_model(model_name)
+    return {"model": model, "tokenizer": tokenizer, "generate_kwargs": generate_kwargs}
+
+def generate_text(entry: dict, texts: List[str], **generate_kwargs) -> List[str]:
+    """Tokenize, generate and decode a batch of texts with a loaded seq2seq model."""
+    tokenizer = entry["tokenizer"]
+    model = entry["model"]
+    inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True).to(model.device)
+    with torch.inference_mode(), torch.autocast(
+        device_type=model.device.type, dtype=DTYPE, enabled=model.device.type == "cuda"
+    ):
+        output_ids = model.generate(**inputs, **{**entry["generate_kwargs"], **generate_kwargs})
+    return tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+
+# Translation models - English to other languages, loaded on first use
+TRANSLATOR_MODELS = {
+    "translator_en_es": "Helsinki-NLP/opus-mt-en-es",
+    "translator_en_fr": "Helsinki-NLP/opus-mt-en-fr",
+    "translator_en_de": "Helsinki-NLP/opus-mt-en-de",
+    "translator_en_it": "Helsinki-NLP/opus-mt-en-it",
+    "translator_en_pt": "Helsinki-NLP/opus-mt-en-roa",  # Romance languages
+    "translator_en_nl": "Helsinki-NLP/opus-mt-en-nl",
+    "translator_en_ru": "Helsinki-NLP/opus-mt-en-ru",
+    "translator_en_zh": "Helsinki-NLP/opus-mt-en-zh",
+}
+TRANSLATOR_CACHE_SIZE = 4
+# One lock per language pair so a cold load never stalls lookups for other pairs
+translator_locks = {}
+translator_locks_guard = threading.Lock()
+
+@functools.lru_cache(maxsize=TRANSLATOR_CACHE_SIZE)
+def _load_translator(model_key: str) -> dict:
+    logger.info(f"Loading translation model {TRANSLATOR_MODELS[model_key]}")
+    return load_seq2seq_model(TRANSLATOR_MODELS[model_key])
+
+def get_translator(model_key: str) -> dict:
+    """Return a translator entry, loading it (and evicting the least recently used) on a miss."""
+    with translator_locks_guard:
+        lock = translator_locks.setdefault(model_key, threading.Lock())
+    # Concurrent first requests for the same pair wait here instead of loading it twice
+    with lock:
+        return _load_translator(model_key)
+
+# Translator lookups run here rather than on inference_executor, so a cold
+# load doesn't hold an inference worker. One thread per possible in-flight
+# translate batch, so warm lookups never queue behind a load.
+model_load_executor = ThreadPoolExecutor(
+    max_workers=len(TRANSLATOR_MODELS) * INFERENCE_WORKERS,
+    thread_name_prefix="model-load"
+)
+
+def warmup_models(translator_keys: List[str]):
+    """Run dummy generations per model so lazy kernel setup happens before the first request."""
+    # Two input lengths so compiled graphs are specialized for dynamic shapes
+    for repeat in (20, 60):
+        generate_text(models["summarizer"], ["warmup text " * repeat], max_length=20, min_length=5)
+    for model_key in translator_keys:
+        for repeat in (1, 10):
+            generate_text(get_translator(model_key), ["warmup text " * repeat])
+
+async def save_worker():
+    """Drain save_queue into insert_many calls; a None item flushes and stops the worker."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = []
+        item = await save_queue.get()
+        deadline = loop.time() + SAVE_FLUSH_INTERVAL
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= SAVE_BATCH_SIZE:
+                break
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(save_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+        if batch:
+            # Don't wait on Mongo before collecting the next batch, unless
+            # MAX_PENDING_WRITES flushes are already in flight
+            await write_slots.acquire()
+            task = asyncio.create_task(insert_saved_content(batch))
+            pending_writes.add(task)
+            task.add_done_callback(pending_writes.discard)
+        if item is None:
+            return
+
+async def insert_saved_content(batch: List[dict]):
+    try:
+        await db.saved_content.insert_many(batch, ordered=False)
+    except Exception as e:
+        logger.error(f"Failed to save {len(batch)} documents: {str(e)}")
+    finally:
+        write_slots.release()
+
+def enqueue_saved_content(doc: dict):
+    """Buffer a history doc for save_worker, dropping it if the buffer is full."""
+    try:
+        save_queue.put_nowait(doc)
+    except asyncio.QueueFull:
+        logger.warning(f"Save queue full, dropping {doc['content_type']} history entry {doc['id']}")
+
+QUIZ_SYSTEM_MESSAGE = "You are an expert quiz generator for educational content. Generate multiple-choice questions with clear explanations."
+
 # Load models on startup
 @app.on_event("startup")
 async def load_models():
+    app.state.save_worker = asyncio.create_task(save_worker())
+    try:
+        # Backs the newest-first sort in /history
+        await db.saved_content.create_index([("timestamp", -1)])
+    except Exception as e:
+        logger.error(f"Error creating history index: {str(e)}")
+    
+    # Quiz chats share one pre-configured constructor instead of re-reading
+    # the key and system prompt on every request
+    emergent_key = os.environ.get('EMERGENT_LLM_KEY')
+    if emergent_key:
+        models["quiz_chat_factory"] = functools.partial(
+            LlmChat,
+            api_key=emergent_key,
+            system_message=QUIZ_SYSTEM_MESSAGE
+        )
+    
     try:
         logger.info("Loading Hugging Face models...")
-        models["summarizer"] = pipeline("summarization", model="facebook/bart-large-cnn")
+        models["summarizer"] = load_seq2seq_model("sshleifer/distilbart-cnn-12-6", do_sample=False)
         
-        # Translation models - English to other languages
-        models["translator_en_es"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-es")
-        models["translator_en_fr"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-fr")
-        models["translator_en_de"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-de")
-        models["translator_en_it"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-it")
-        models["translator_en_pt"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-roa")  # Romance languages
-        models["translator_en_nl"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-nl")
-        models["translator_en_ru"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-ru")
-        models["translator_en_zh"] = pipeline("translation", model="Helsinki-NLP/opus-mt-en-zh")
+        # Translators load lazily; PRELOAD_TRANSLATORS (e.g. "es,fr") loads the
+        # listed target languages up front on long-lived pods
+        preload_keys = []
+        for lang in os.environ.get('PRELOAD_TRANSLATORS', '').split(','):
+            lang = lang.strip().lower()
+            if not lang:
+                continue
+            model_key = f"translator_en_{lang}"
+            if model_key not in TRANSLATOR_MODELS:
+                logger.warning(f"Ignoring unknown PRELOAD_TRANSLATORS language: {lang}")
+                continue
+            preload_keys.append(model_key)
+        if len(preload_keys) > TRANSLATOR_CACHE_SIZE:
+            logger.warning(
+                f"PRELOAD_TRANSLATORS lists more than {TRANSLATOR_CACHE_SIZE} languages, "
+                f"skipping: {', '.join(preload_keys[TRANSLATOR_CACHE_SIZE:])}"
+            )
+            preload_keys = preload_keys[:TRANSLATOR_CACHE_SIZE]
+        for model_key in preload_keys:
+            get_translator(model_key)
         
         logger.info("All models loaded successfully")
+        
+        warmup_models(preload_keys)
+        app.state.ready = True
+        logger.info("Models warmed up, ready to serve")
     except Exception as e:
         logger.error(f"Error loading models: {str(e)}")
 
+# Request batching: concurrent calls are grouped into one generate() call so
+# the weights are streamed once per batch instead of once per request. Each
+# batcher may run a batch on every inference worker at once.
+BATCH_MAX_SIZE = 8
+BATCH_MAX_QUEUE_TIME = 0.02  # seconds
+
+class SummarizeBatcher(AsyncBatcher[tuple, str]):
+    """Batches (text, max_length, min_length) items through the summarizer."""
+    def process_batch(self, batch):
+        summaries = [None] * len(batch)
+        # Generation lengths are per-call generate() kwargs, so batch per length pair
+        groups = {}
+        for i, (_, max_length, min_length) in enumerate(batch):
+            groups.setdefault((max_length, min_length), []).append(i)
+        for (max_length, min_length), indices in groups.items():
+            results = generate_text(
+                models["summarizer"],
+                [batch[i][0] for i in indices],
+                max_length=max_length,
+                min_length=min_length
+            )
+            for i, summary in zip(indices, results):
+                summaries[i] = summary
+        return summaries
+
+class TranslateBatcher(AsyncBatcher[str, str]):
+    """Batches texts through a single translator model."""
+    def __init__(self, model_key: str, **kwargs):
+        super().__init__(**kwargs)
+        self.model_key = model_key
+
+    async def process_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(model_load_executor, get_translator, self.model_key)
+        return await loop.run_in_executor(inference_executor, generate_text, entry, batch)
+
+summarize_batcher = SummarizeBatcher(
+    max_batch_size=BATCH_MAX_SIZE,
+    max_queue_time=BATCH_MAX_QUEUE_TIME,
+    concurrency=INFERENCE_WORKERS,
+    executor=inference_executor
+)
+translate_batchers = {}
+
+def get_translate_batcher(model_key: str) -> TranslateBatcher:
+    if model_key not in translate_batchers:
+        translate_batchers[model_key] = TranslateBatcher(
+            model_key,
+            max_batch_size=BATCH_MAX_SIZE,
+            max_queue_time=BATCH_MAX_QUEUE_TIME,
+            concurrency=INFERENCE_WORKERS
+        )
+    return translate_batchers[model_key]
+
+# Summarizer input is truncated to this many characters
+SUMMARIZE_MAX_CHARS = 1024
+# Granularity of the input-based summary length cap
+SUMMARY_LENGTH_BUCKET = 32
+
 # Define Models
 class SummarizeRequest(BaseModel):
     text: str = Field(..., min_length=10, max_length=5000)
-    max_length: Optional[int] = Field(default=150)
-    min_length: Optional[int] = Field(default=40)
+    max_length: Optional[int] = Field(default=150, ge=1)
+    min_length: Optional[int] = Field(default=40, ge=0)
+
+    @model_validator(mode="after")
+    def clamp_lengths(self):
+        # Don't decode a summary longer than about half the (truncated) input,
+        # and keep min_length below max_length so generation can stop. The cap
+        # is rounded down to a bucket so similar-sized inputs still share a batch.
+        if self.max_length is not None:
+            cap = len(self.text[:SUMMARIZE_MAX_CHARS].split()) // 2
+            cap = max(20, cap // SUMMARY_LENGTH_BUCKET * SUMMARY_LENGTH_BUCKET)
+            self.max_length = min(self.max_length, cap)
+            if self.min_length is not None:
+                self.min_length = min(self.min_length, self.max_length - 1)
+        return self
 
 class SummarizeResponse(BaseModel):
     summary: str
@@ -90,10 +481,30 @@ class QuizQuestion(BaseModel):
     correct_answer: str
     explanation: str
 
+class QuizPayload(BaseModel):
+    """Shape of the JSON the LLM is asked to return."""
+    questions: List[QuizQuestion]
+
 class QuizResponse(BaseModel):
     questions: List[QuizQuestion]
     source_text: str
 
+class BatchOperation(BaseModel):
+    id: Optional[str] = None
+    operation: Literal["summarize", "translate", "quiz"]
+    body: dict
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=20)
+
+class BatchOperationResult(BaseModel):
+    id: Optional[str] = None
+    status: int
+    body: dict
+
+class BatchResponse(BaseModel):
+    responses: List[BatchOperationResult]
+
 class SavedContent(BaseModel):
     model_config = ConfigDict(extra="ignore")
     
@@ -103,11 +514,38 @@ class SavedContent(BaseModel):
     result: dict
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+def cache_key(*parts) -> str:
+    return hashlib.sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+
+async def cache_get(key: str) -> Optional[str]:
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed: {str(e)}")
+        return None
+
+async def cache_set(key: str, value: str):
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, value, ex=CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Cache write failed: {str(e)}")
+
 # Routes
 @api_router.get("/")
 async def root():
     return {"message": "SmartLearn API is running", "status": "active"}
 
+@api_router.get("/ready")
+async def ready():
+    # Readiness probe: 503 until models are loaded and warmed up
+    if not app.state.ready:
+        raise HTTPException(status_code=503, detail="Models not ready")
+    return {"status": "ready"}
+
 @api_router.post("/summarize", response_model=SummarizeResponse)
 async def summarize_text(request: SummarizeRequest):
     try:
@@ -115,16 +553,15 @@ async def summarize_text(request: SummarizeRequest):
             raise HTTPException(status_code=503, detail="Summarizer model not loaded")
         
         # Truncate if too long
-        text_to_process = request.text[:1024] if len(request.text) > 1024 else request.text
-        
-        result = models["summarizer"](
-            text_to_process,
-            max_length=request.max_length,
-            min_length=request.min_length,
-            do_sample=False
-        )
+        text_to_process = request.text[:SUMMARIZE_MAX_CHARS]
         
-        summary = result[0]["summary_text"]
+        key = cache_key("sum", request.text, request.max_length, request.min_length)
+        summary = await cache_get(key)
+        if summary is None:
+            summary = await summarize_batcher.process(
+                (text_to_process, request.max_length, request.min_length)
+            )
+            await cache_set(key, summary)
         
         # Save to database
         doc = {
@@ -132,9 +569,9 @@ async def summarize_text(request: SummarizeRequest):
             "content_type": "summary",
             "original_text": request.text,
             "result": {"summary": summary},
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": datetime.now(timezone.utc)
         }
-        await db.saved_content.insert_one(doc)
+        enqueue_saved_content(doc)
         
         return SummarizeResponse(
             summary=summary,
@@ -145,6 +582,91 @@ async def summarize_text(request: SummarizeRequest):
         logger.error(f"Summarization error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
+class StopOnEvent(StoppingCriteria):
+    """Stops generation once the event is set, e.g. when the client went away."""
+    def __init__(self, event: threading.Event):
+        self.event = event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full((input_ids.shape[0],), self.event.is_set(), dtype=torch.bool, device=input_ids.device)
+
+def stream_summary(
+    streamer: TextIteratorStreamer, stop: threading.Event, text: str, max_length: int, min_length: int
+):
+    try:
+        # Streamers don't support beam search, so streamed summaries decode greedily
+        generate_text(
+            models["summarizer"],
+            [text],
+            streamer=streamer,
+            stopping_criteria=StoppingCriteriaList([StopOnEvent(stop)]),
+            num_beams=1,
+            max_length=max_length,
+            min_length=min_length
+        )
+    finally:
+        # Unblock the reader even if generation fails part-way
+        streamer.end()
+
+@api_router.get("/summarize/stream")
+async def summarize_stream(
+    text: str = Query(..., min_length=10, max_length=5000),
+    max_length: Optional[int] = Query(default=150, ge=1),
+    min_length: Optional[int] = Query(default=40, ge=0)
+):
+    """Server-sent events: one JSON-encoded text chunk per `data:` event, then a `done` event."""
+    if "summarizer" not in models:
+        raise HTTPException(status_code=503, detail="Summarizer model not loaded")
+    
+    request = SummarizeRequest(text=text, max_length=max_length, min_length=min_length)
+    text_to_process = request.text[:SUMMARIZE_MAX_CHARS]
+    streamer = TextIteratorStreamer(
+        models["summarizer"]["tokenizer"],
+        skip_prompt=True,
+        skip_special_tokens=True
+    )
+    
+    async def event_stream():
+        stop = threading.Event()
+        generation = asyncio.get_running_loop().run_in_executor(
+            inference_executor,
+            functools.partial(
+                stream_summary, streamer, stop, text_to_process, request.max_length, request.min_length
+            )
+        )
+        try:
+            chunks = []
+            while True:
+                # The streamer blocks on a queue, so read it off the event loop
+                chunk = await asyncio.to_thread(next, streamer, None)
+                if chunk is None:
+                    break
+                if chunk:
+                    chunks.append(chunk)
+                    yield f"data: {orjson.dumps(chunk).decode()}\n\n"
+            try:
+                await generation
+            except Exception as e:
+                logger.error(f"Streaming summarization error: {str(e)}")
+                yield f"event: error\ndata: {orjson.dumps('Summarization failed').decode()}\n\n"
+                return
+            
+            summary = "".join(chunks).strip()
+            enqueue_saved_content({
+                "id": str(uuid.uuid4()),
+                "content_type": "summary",
+                "original_text": request.text,
+                "result": {"summary": summary},
+                "timestamp": datetime.now(timezone.utc)
+            })
+            yield f"event: done\ndata: {orjson.dumps(summary).decode()}\n\n"
+        finally:
+            # On client disconnect the generator is cancelled; stop decoding so
+            # the abandoned stream frees its inference worker
+            stop.set()
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @api_router.post("/translate", response_model=TranslateResponse)
 async def translate_text(request: TranslateRequest):
     try:
@@ -170,14 +692,14 @@ async def translate_text(request: TranslateRequest):
         
         model_key = model_map[lang_pair]
         
-        if model_key not in models:
-            raise HTTPException(status_code=503, detail="Translation model not loaded")
-        
         # Truncate if too long
         text_to_process = request.text[:512] if len(request.text) > 512 else request.text
         
-        result = models[model_key](text_to_process)
-        translated = result[0]["translation_text"]
+        key = cache_key("tr", request.text, *lang_pair)
+        translated = await cache_get(key)
+        if translated is None:
+            translated = await get_translate_batcher(model_key).process(text_to_process)
+            await cache_set(key, translated)
         
         # Save to database
         doc = {
@@ -189,9 +711,9 @@ async def translate_text(request: TranslateRequest):
                 "source_lang": request.source_lang,
                 "target_lang": request.target_lang
             },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": datetime.now(timezone.utc)
         }
-        await db.saved_content.insert_one(doc)
+        enqueue_saved_content(doc)
         
         return TranslateResponse(
             original_text=request.text,
@@ -208,18 +730,20 @@ async def translate_text(request: TranslateRequest):
 @api_router.post("/quiz", response_model=QuizResponse)
 async def generate_quiz(request: QuizRequest):
     try:
-        emergent_key = os.environ.get('EMERGENT_LLM_KEY')
-        if not emergent_key:
+        if "quiz_chat_factory" not in models:
             raise HTTPException(status_code=503, detail="API key not configured")
         
-        # Initialize Gemini chat
-        chat = LlmChat(
-            api_key=emergent_key,
-            session_id=f"quiz_{uuid.uuid4()}",
-            system_message="You are an expert quiz generator for educational content. Generate multiple-choice questions with clear explanations."
-        ).with_model("gemini", "gemini-2.0-flash")
+        key = cache_key("quiz", request.text, request.num_questions)
+        cached = await cache_get(key)
+        if cached is not None:
+            quiz = QuizPayload.model_validate_json(cached)
+        else:
+            # Fresh session per quiz so one user's history never leaks into another's prompt
+            chat = models["quiz_chat_factory"](
+                session_id=f"quiz_{uuid.uuid4()}"
+            ).with_model("gemini", "gemini-2.0-flash")
         
-        prompt = f"""
+            prompt = f"""
 Based on the following text, generate {request.num_questions} multiple-choice questions.
 
 Text: {request.text}
@@ -245,20 +769,15 @@ Format your response as JSON with this structure:
 Provide ONLY the JSON, no additional text.
 """
         
-        user_message = UserMessage(text=prompt)
-        response = await chat.send_message(user_message)
+            user_message = UserMessage(text=prompt)
+            response = await chat.send_message(user_message)
         
-        # Parse the response
-        import json
-        response_text = response.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-        
-        quiz_data = json.loads(response_text)
-        questions = [QuizQuestion(**q) for q in quiz_data["questions"]]
+            # Parse and validate in one native pass; slicing to the outer braces
+            # drops any markdown fence or stray prose around the object
+            response_text = response[response.find("{"):response.rfind("}") + 1]
+            quiz = QuizPayload.model_validate_json(response_text)
+            await cache_set(key, quiz.model_dump_json())
+        questions = quiz.questions
         
         # Save to database
         doc = {
@@ -266,16 +785,18 @@ Provide ONLY the JSON, no additional text.
             "content_type": "quiz",
             "original_text": request.text,
             "result": {"questions": [q.dict() for q in questions]},
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": datetime.now(timezone.utc)
         }
-        await db.saved_content.insert_one(doc)
+        enqueue_saved_content(doc)
         
         return QuizResponse(
             questions=questions,
             source_text=request.text
         )
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parsing error: {str(e)}")
+    except HTTPException:
+        raise
+    except ValidationError as e:
+        logger.error(f"Quiz response parsing error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to parse quiz response")
     except Exception as e:
         logger.error(f"Quiz generation error: {str(e)}")
@@ -290,6 +811,33 @@ async def get_history():
         logger.error(f"History fetch error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch history")
 
+BATCH_HANDLERS = {
+    "summarize": (SummarizeRequest, summarize_text),
+    "translate": (TranslateRequest, translate_text),
+    "quiz": (QuizRequest, generate_quiz),
+}
+
+async def run_batch_operation(operation: BatchOperation) -> BatchOperationResult:
+    request_model, handler = BATCH_HANDLERS[operation.operation]
+    try:
+        response = await handler(request_model(**operation.body))
+        return BatchOperationResult(id=operation.id, status=200, body=response.model_dump())
+    except ValidationError as e:
+        return BatchOperationResult(
+            id=operation.id,
+            status=422,
+            body={"detail": e.errors(include_url=False, include_context=False)}
+        )
+    except HTTPException as e:
+        return BatchOperationResult(id=operation.id, status=e.status_code, body={"detail": e.detail})
+
+@api_router.post("/batch", response_model=BatchResponse)
+async def batch(request: BatchRequest):
+    # Run every sub-request concurrently so they share a round trip and can
+    # land in the same model batch
+    responses = await asyncio.gather(*(run_batch_operation(op) for op in request.operations))
+    return BatchResponse(responses=responses)
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -303,4 +851,15 @@ app.add_middleware(
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await summarize_batcher.stop()
+    for batcher in translate_batchers.values():
+        await batcher.stop()
+    # Flush buffered history writes before the client goes away
+    await save_queue.put(None)
+    await app.state.save_worker
+    await asyncio.gather(*pending_writes)
     client.close()
+    if redis_client is not None:
+        await redis_client.aclose()
+    inference_executor.shutdown(wait=False)
+    model_load_executor.shutdown(wait=False)
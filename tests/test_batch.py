@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+
+@pytest.fixture
+def fake_handlers(monkeypatch):
+    async def summarize(request):
+        return server.SummarizeResponse(summary="short", original_length=len(request.text), summary_length=5)
+
+    async def translate(request):
+        raise HTTPException(status_code=400, detail="Unsupported language pair")
+
+    monkeypatch.setitem(server.BATCH_HANDLERS, "summarize", (server.SummarizeRequest, summarize))
+    monkeypatch.setitem(server.BATCH_HANDLERS, "translate", (server.TranslateRequest, translate))
+
+
+def run(operation):
+    return asyncio.run(server.run_batch_operation(server.BatchOperation(**operation)))
+
+
+def test_success_returns_200_with_response_body(fake_handlers):
+    result = run({"id": "a", "operation": "summarize", "body": {"text": "some longer text"}})
+
+    assert result.id == "a"
+    assert result.status == 200
+    assert result.body == {"summary": "short", "original_length": 16, "summary_length": 5}
+
+
+def test_invalid_body_returns_422(fake_handlers):
+    result = run({"id": "b", "operation": "summarize", "body": {"text": "short"}})
+
+    assert result.status == 422
+    assert result.body["detail"][0]["loc"] == ("text",)
+
+
+def test_http_exception_keeps_status_and_detail(fake_handlers):
+    result = run({"id": "c", "operation": "translate", "body": {"text": "hello", "target_lang": "xx"}})
+
+    assert result.status == 400
+    assert result.body == {"detail": "Unsupported language pair"}
+
+
+def test_batch_preserves_operation_order(fake_handlers):
+    request = server.BatchRequest(operations=[
+        {"id": "1", "operation": "translate", "body": {"text": "hello", "target_lang": "xx"}},
+        {"id": "2", "operation": "summarize", "body": {"text": "some longer text"}},
+    ])
+
+    response = asyncio.run(server.batch(request))
+
+    assert [(r.id, r.status) for r in response.responses] == [("1", 400), ("2", 200)]
@@ -0,0 +1,41 @@
+import asyncio
+
+import server
+
+
+def test_cache_key_is_stable_sha256_hex():
+    key = server.cache_key("sum", "some text", 150, 40)
+
+    assert key == server.cache_key("sum", "some text", 150, 40)
+    assert len(key) == 64
+    int(key, 16)
+
+
+def test_cache_key_depends_on_every_part():
+    base = server.cache_key("sum", "some text", 150, 40)
+
+    assert server.cache_key("tr", "some text", 150, 40) != base
+    assert server.cache_key("sum", "other text", 150, 40) != base
+    assert server.cache_key("sum", "some text", 100, 40) != base
+    assert server.cache_key("sum", "some text", 150, 30) != base
+
+
+class FailingRedis:
+    async def get(self, key):
+        raise ConnectionError("redis unavailable")
+
+    async def set(self, key, value, ex=None):
+        raise ConnectionError("redis unavailable")
+
+
+def test_cache_errors_are_misses(monkeypatch):
+    monkeypatch.setattr(server, "redis_client", FailingRedis())
+
+    assert asyncio.run(server.cache_get("key")) is None
+    asyncio.run(server.cache_set("key", "value"))
+
+
+def test_cache_disabled_without_client(monkeypatch):
+    monkeypatch.setattr(server, "redis_client", None)
+
+    assert asyncio.run(server.cache_get("key")) is None
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+QUIZ_JSON = (
+    '{"questions": [{"question": "What is 2 + 2?", "options": ["A. 3", "B. 4", "C. 5", "D. 6"],'
+    ' "correct_answer": "B", "explanation": "Basic arithmetic."}]}'
+)
+
+
+class FakeChat:
+    def __init__(self, reply):
+        self.reply = reply
+
+    def with_model(self, provider, model):
+        return self
+
+    async def send_message(self, message):
+        return self.reply
+
+
+class FakeQueue:
+    def __init__(self):
+        self.items = []
+
+    def put_nowait(self, item):
+        self.items.append(item)
+
+
+@pytest.fixture
+def quiz_reply(monkeypatch):
+    """Set the text the fake LLM returns; returns the queue saved docs land in."""
+    queue = FakeQueue()
+    monkeypatch.setattr(server, "redis_client", None)
+    monkeypatch.setattr(server, "save_queue", queue)
+
+    def set_reply(reply):
+        monkeypatch.setitem(server.models, "quiz_chat_factory", lambda **kwargs: FakeChat(reply))
+        return queue
+
+    return set_reply
+
+
+def generate(num_questions=1):
+    request = server.QuizRequest(text="Two plus two equals four.", num_questions=num_questions)
+    return asyncio.run(server.generate_quiz(request))
+
+
+@pytest.mark.parametrize("reply", [
+    QUIZ_JSON,
+    f"```json\n{QUIZ_JSON}\n```",
+    f"Here is your quiz:\n{QUIZ_JSON}\nGood luck!",
+])
+def test_parses_json_with_surrounding_text(quiz_reply, reply):
+    queue = quiz_reply(reply)
+
+    response = generate()
+
+    assert [q.correct_answer for q in response.questions] == ["B"]
+    assert response.questions[0].options[1] == "B. 4"
+    assert queue.items[0]["content_type"] == "quiz"
+
+
+@pytest.mark.parametrize("reply", [
+    "I can't help with that.",
+    '{"questions": [{"question": "Missing fields"}]}',
+    '{"quiz": []}',
+])
+def test_malformed_reply_is_a_parse_error(quiz_reply, reply):
+    quiz_reply(reply)
+
+    with pytest.raises(HTTPException) as exc_info:
+        generate()
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail == "Failed to parse quiz response"
+
+
+def test_missing_chat_factory_is_503(monkeypatch):
+    monkeypatch.delitem(server.models, "quiz_chat_factory", raising=False)
+
+    with pytest.raises(HTTPException) as exc_info:
+        generate()
+
+    assert exc_info.value.status_code == 503
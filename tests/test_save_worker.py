@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+import server
+
+
+class FakeCollection:
+    def __init__(self):
+        self.batches = []
+
+    async def insert_many(self, docs, ordered=True):
+        self.batches.append(list(docs))
+
+
+class FakeDb:
+    def __init__(self):
+        self.saved_content = FakeCollection()
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDb()
+    monkeypatch.setattr(server, "db", db)
+    return db
+
+
+async def start_worker(monkeypatch):
+    # Queue and semaphore are loop-bound, so create them inside the test's loop
+    monkeypatch.setattr(server, "save_queue", asyncio.Queue(maxsize=server.SAVE_QUEUE_MAXSIZE))
+    monkeypatch.setattr(server, "write_slots", asyncio.Semaphore(server.MAX_PENDING_WRITES))
+    return asyncio.create_task(server.save_worker())
+
+
+async def stop_worker(worker):
+    await server.save_queue.put(None)
+    await worker
+    await asyncio.gather(*server.pending_writes)
+
+
+def test_flushes_in_batches_of_at_most_batch_size(monkeypatch, fake_db):
+    async def scenario():
+        worker = await start_worker(monkeypatch)
+        for i in range(server.SAVE_BATCH_SIZE * 2 + 20):
+            server.save_queue.put_nowait({"n": i})
+        await stop_worker(worker)
+
+    asyncio.run(scenario())
+
+    sizes = [len(batch) for batch in fake_db.saved_content.batches]
+    assert sizes == [server.SAVE_BATCH_SIZE, server.SAVE_BATCH_SIZE, 20]
+    assert [doc["n"] for batch in fake_db.saved_content.batches for doc in batch] == list(range(120))
+
+
+def test_flushes_partial_batch_after_flush_interval(monkeypatch, fake_db):
+    async def scenario():
+        worker = await start_worker(monkeypatch)
+        server.save_queue.put_nowait({"n": 1})
+        await asyncio.sleep(server.SAVE_FLUSH_INTERVAL * 3)
+        flushed = list(fake_db.saved_content.batches)
+        await stop_worker(worker)
+        return flushed
+
+    flushed = asyncio.run(scenario())
+
+    assert flushed == [[{"n": 1}]]
+
+
+def test_sentinel_flushes_pending_docs_and_stops(monkeypatch, fake_db):
+    async def scenario():
+        worker = await start_worker(monkeypatch)
+        for i in range(3):
+            server.save_queue.put_nowait({"n": i})
+        await stop_worker(worker)
+        return worker
+
+    worker = asyncio.run(scenario())
+
+    assert worker.done()
+    assert fake_db.saved_content.batches == [[{"n": 0}, {"n": 1}, {"n": 2}]]
+
+
+def test_in_flight_flushes_are_capped(monkeypatch, fake_db):
+    in_flight = 0
+    peak = 0
+    release = None
+
+    async def slow_insert_many(docs, ordered=True):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await release.wait()
+        in_flight -= 1
+
+    monkeypatch.setattr(fake_db.saved_content, "insert_many", slow_insert_many)
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        worker = await start_worker(monkeypatch)
+        for i in range(server.SAVE_BATCH_SIZE * (server.MAX_PENDING_WRITES + 2)):
+            server.save_queue.put_nowait({"n": i})
+        await asyncio.sleep(0.05)
+        stalled_peak = peak
+        release.set()
+        await stop_worker(worker)
+        return stalled_peak
+
+    assert asyncio.run(scenario()) == server.MAX_PENDING_WRITES
+
+
+def test_full_queue_drops_doc_with_warning(monkeypatch, caplog):
+    async def scenario():
+        monkeypatch.setattr(server, "save_queue", asyncio.Queue(maxsize=1))
+        server.enqueue_saved_content({"id": "kept", "content_type": "summary"})
+        server.enqueue_saved_content({"id": "dropped", "content_type": "quiz"})
+        return server.save_queue.get_nowait()
+
+    kept = asyncio.run(scenario())
+
+    assert kept["id"] == "kept"
+    assert "dropping quiz history entry dropped" in caplog.text
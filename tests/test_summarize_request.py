@@ -0,0 +1,66 @@
+import pytest
+from pydantic import ValidationError
+
+import server
+
+
+def words(n):
+    return " ".join(["word"] * n)
+
+
+def test_defaults_kept_when_under_cap():
+    request = server.SummarizeRequest(text=words(1000), max_length=60)
+
+    assert (request.max_length, request.min_length) == (60, 40)
+
+
+def test_max_length_capped_to_bucketed_half_input():
+    request = server.SummarizeRequest(text=words(100))
+
+    # 100 words // 2 = 50, rounded down to the bucket below
+    assert request.max_length == 32
+    assert request.max_length % server.SUMMARY_LENGTH_BUCKET == 0
+
+
+def test_similar_inputs_share_a_length_bucket():
+    lengths = {server.SummarizeRequest(text=words(n)).max_length for n in range(64, 128)}
+
+    assert lengths == {32}
+
+
+def test_short_input_gets_floor_cap():
+    request = server.SummarizeRequest(text=words(10))
+
+    assert (request.max_length, request.min_length) == (20, 19)
+
+
+def test_cap_counts_only_truncated_text():
+    capped = server.SummarizeRequest(text=words(1000)).max_length
+    truncated = server.SummarizeRequest(text=words(1000)[:server.SUMMARIZE_MAX_CHARS])
+
+    # 1024 characters of "word " is 205 words: 102, rounded down to 96
+    assert capped == truncated.max_length == 96
+
+
+def test_min_length_kept_below_max_length():
+    request = server.SummarizeRequest(text=words(1000), max_length=30, min_length=50)
+
+    assert (request.max_length, request.min_length) == (30, 29)
+
+
+def test_smallest_max_length_gives_zero_min_length():
+    request = server.SummarizeRequest(text=words(1000), max_length=1)
+
+    assert (request.max_length, request.min_length) == (1, 0)
+
+
+@pytest.mark.parametrize("lengths", [{"max_length": 0}, {"max_length": -5}, {"min_length": -1}])
+def test_out_of_range_lengths_rejected(lengths):
+    with pytest.raises(ValidationError):
+        server.SummarizeRequest(text=words(100), **lengths)
+
+
+def test_null_max_length_left_alone():
+    request = server.SummarizeRequest(text=words(100), max_length=None)
+
+    assert (request.max_length, request.min_length) == (None, 40)
@@ -0,0 +1,108 @@
+import asyncio
+import queue
+import threading
+
+import pytest
+import torch
+
+import server
+
+TEXT = " ".join(["word"] * 100)
+
+
+class FakeStreamer:
+    def __init__(self, tokenizer, **kwargs):
+        self.chunks = queue.Queue()
+
+    def put_text(self, text):
+        self.chunks.put(text)
+
+    def end(self):
+        self.chunks.put(None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = self.chunks.get(timeout=5)
+        if chunk is None:
+            raise StopIteration
+        return chunk
+
+
+class FakeQueue:
+    def __init__(self):
+        self.items = []
+
+    def put_nowait(self, item):
+        self.items.append(item)
+
+
+@pytest.fixture
+def fake_summarizer(monkeypatch):
+    monkeypatch.setitem(server.models, "summarizer", {"tokenizer": None})
+    monkeypatch.setattr(server, "TextIteratorStreamer", FakeStreamer)
+    saved = FakeQueue()
+    monkeypatch.setattr(server, "save_queue", saved)
+    return saved
+
+
+def stub_generate_text(monkeypatch, chunks, wait_for_stop=False):
+    state = {"saw_stop": False, "done": threading.Event()}
+
+    def generate_text(entry, texts, streamer, stopping_criteria, **kwargs):
+        try:
+            for chunk in chunks:
+                streamer.put_text(chunk)
+            if wait_for_stop:
+                input_ids = torch.zeros((1, 1), dtype=torch.long)
+                for _ in range(500):
+                    if stopping_criteria(input_ids, None).all():
+                        state["saw_stop"] = True
+                        break
+                    threading.Event().wait(0.01)
+        finally:
+            state["done"].set()
+
+    monkeypatch.setattr(server, "generate_text", generate_text)
+    return state
+
+
+async def open_stream():
+    response = await server.summarize_stream(text=TEXT, max_length=50, min_length=10)
+    return response.body_iterator
+
+
+def test_client_disconnect_stops_generation(monkeypatch, fake_summarizer):
+    state = stub_generate_text(monkeypatch, ["Partial"], wait_for_stop=True)
+
+    async def scenario():
+        events = await open_stream()
+        first = await events.__anext__()
+        await events.aclose()
+        return first
+
+    first = asyncio.run(scenario())
+
+    assert first == 'data: "Partial"\n\n'
+    assert state["done"].wait(timeout=5)
+    assert state["saw_stop"]
+    assert fake_summarizer.items == []
+
+
+def test_done_event_carries_joined_chunks(monkeypatch, fake_summarizer):
+    stub_generate_text(monkeypatch, ["Hello", " streamed", " world "])
+
+    async def scenario():
+        events = await open_stream()
+        return [event async for event in events]
+
+    events = asyncio.run(scenario())
+
+    assert events == [
+        'data: "Hello"\n\n',
+        'data: " streamed"\n\n',
+        'data: " world "\n\n',
+        'event: done\ndata: "Hello streamed world"\n\n',
+    ]
+    assert fake_summarizer.items[0]["result"] == {"summary": "Hello streamed world"}
@@ -0,0 +1,56 @@
+import pytest
+import torch
+from transformers import BatchEncoding
+
+import server
+
+
+class FakeTokenizer:
+    def __call__(self, texts, return_tensors="pt", padding=False):
+        ids = [[len(word) for word in text.split()] for text in texts]
+        width = max(len(row) for row in ids)
+        return BatchEncoding({
+            "input_ids": torch.tensor([row + [0] * (width - len(row)) for row in ids]),
+            "attention_mask": torch.tensor([[1] * len(row) + [0] * (width - len(row)) for row in ids]),
+        })
+
+
+class FakeEncoder(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.embed = torch.nn.Embedding(32, 4)
+
+    def forward(self, input_ids, attention_mask, return_dict=True):
+        return (self.embed(input_ids) * attention_mask.unsqueeze(-1),)
+
+
+class LengthBakingEncoder(FakeEncoder):
+    def forward(self, input_ids, attention_mask, return_dict=True):
+        # int() becomes a constant in the trace, so other lengths diverge
+        return (self.embed(input_ids) * int(attention_mask.sum()),)
+
+
+class FakeModel:
+    def __init__(self, encoder):
+        self.encoder = encoder
+
+    def get_encoder(self):
+        return self.encoder
+
+
+def test_matching_trace_replaces_encoder():
+    model = FakeModel(FakeEncoder().eval())
+
+    server.trace_encoder(model, FakeTokenizer())
+
+    assert isinstance(model.get_encoder(), server.TracedEncoder)
+
+
+def test_mismatching_trace_keeps_eager_encoder():
+    encoder = LengthBakingEncoder().eval()
+    model = FakeModel(encoder)
+
+    with pytest.raises(RuntimeError, match="differs from eager"):
+        server.trace_encoder(model, FakeTokenizer())
+
+    assert model.get_encoder() is encoder
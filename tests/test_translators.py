@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+import server
+
+WARM = "translator_en_es"
+COLD = "translator_en_fr"
+
+
+@pytest.fixture
+def fake_loader(monkeypatch):
+    calls = []
+    release = threading.Event()
+    release.set()
+
+    def load_seq2seq_model(model_name):
+        calls.append((model_name, threading.current_thread().name))
+        if model_name == server.TRANSLATOR_MODELS[COLD]:
+            release.wait(timeout=5)
+        return {"model_name": model_name}
+
+    monkeypatch.setattr(server, "load_seq2seq_model", load_seq2seq_model)
+    monkeypatch.setattr(server, "translator_locks", {})
+    server._load_translator.cache_clear()
+    yield calls, release
+    release.set()
+    server._load_translator.cache_clear()
+
+
+def run_in_threads(target, count):
+    results = [None] * count
+
+    def run(i):
+        results[i] = target()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_lookups_for_one_pair_load_once(fake_loader):
+    calls, release = fake_loader
+    release.clear()
+
+    threads, results = run_in_threads(lambda: server.get_translator(COLD), 4)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_cold_pair_does_not_block_warm_pair(fake_loader):
+    _, release = fake_loader
+    warm = server.get_translator(WARM)
+    release.clear()
+
+    threads, _ = run_in_threads(lambda: server.get_translator(COLD), 1)
+    lookup, results = run_in_threads(lambda: server.get_translator(WARM), 1)
+    lookup[0].join(timeout=1)
+    finished = not lookup[0].is_alive()
+    release.set()
+    threads[0].join(timeout=5)
+
+    assert finished
+    assert results[0] is warm
+
+
+def test_batcher_loads_off_the_inference_pool(monkeypatch, fake_loader):
+    calls, _ = fake_loader
+    monkeypatch.setattr(server, "generate_text", lambda entry, texts: [entry["model_name"]] * len(texts))
+
+    async def scenario():
+        batcher = server.TranslateBatcher(COLD, max_batch_size=server.BATCH_MAX_SIZE)
+        return await batcher.process_batch(["hello", "world"])
+
+    results = asyncio.run(scenario())
+
+    assert results == [server.TRANSLATOR_MODELS[COLD]] * 2
+    assert calls[0][1].startswith("model-load")